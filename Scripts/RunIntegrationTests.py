@@ -44,16 +44,46 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import math
 import os
+import pickle
+import select
 import subprocess
 import sys
-import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Tuple, List, Any, Optional
 
+try:
+    # NumPy lets compare_maps() check thousands of float metrics in a handful
+    # of array operations instead of one interpreter trip per value. Optional:
+    # the scalar comparison path is used when it is not installed.
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # orjson parses the (potentially large) metrics reports several times faster
+    # than the stdlib and accepts bytes directly, skipping the UTF-8 decode pass.
+    # Both accelerated parsers are optional; msgspec's untyped decoder is in the
+    # same performance class as orjson and its DecodeError is a ValueError, so
+    # the existing error handling covers all three.
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        import msgspec.json
+
+        _json_loads = msgspec.json.decode
+    except ImportError:
+        _json_loads = json.loads
+
 
 SolidKey = Tuple[str, int]  # (object_name, index)
 
@@ -62,9 +92,12 @@ SolidKey = Tuple[str, int]  # (object_name, index)
 class CompareConfig:
     match_pct: float  # e.g. 99.999
     abs_tol_mm3: float  # absolute floor tolerance for very small volumes
+    rel_tol: float  # derived once from match_pct via required_rel_tol()
 
 
-@dataclass
+# slots=True drops the per-instance __dict__ (~100 bytes each), which matters
+# when a badly regressed report produces thousands of these rows.
+@dataclass(slots=True)
 class SolidDiff:
     key: SolidKey
     baseline: Optional[float]
@@ -101,6 +134,22 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         help="Absolute tolerance in mm^3 used as a floor near zero (default: 1e-9)",
     )
     p.add_argument("--recursive", action="store_true", help="Recurse into subfolders of fcstd-dir")
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of FreeCAD runs to execute in parallel (default: 0 => CPU count)",
+    )
+    p.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop scheduling FreeCAD runs after the first mismatch or error",
+    )
+    p.add_argument(
+        "--no-persistent",
+        action="store_true",
+        help="Start a fresh FreeCAD process per file instead of reusing --server workers",
+    )
     p.add_argument(
         "--timeout",
         type=float,
@@ -125,45 +174,183 @@ def required_rel_tol(match_pct: float) -> float:
     return 1.0 - (match_pct / 100.0)
 
 
-def run_freecad_script(
-    freecad_exe: Path, script_path: Path, fcstd_path: Path, timeout_s: float
-) -> Dict[str, Any]:
-    with tempfile.TemporaryDirectory() as temp_dir:
-        output_file = os.path.join(temp_dir, "output.json")
-        cmd = [str(freecad_exe), str(script_path), str(fcstd_path), "--out", output_file]
-        proc = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            timeout=timeout_s,
-        )
+# The macro brackets its stdout payload with these sentinels so that FreeCAD
+# log chatter on either side can be discarded (must match EvaluateFile.FCMacro).
+_JSON_BEGIN_SENTINEL = b"<<JSON>>"
+_JSON_END_SENTINEL = b"<</JSON>>"
 
-        if proc.returncode != 0:
-            raise RuntimeError(
-                f"FreeCAD run failed (rc={proc.returncode}) for {fcstd_path}\n"
-                f"STDERR:\n{proc.stderr.strip()}\n\n"
-                f"STDOUT (first 2000 chars):\n{proc.stdout[:2000].strip()}"
-            )
 
-        with open(output_file, "r", encoding="utf-8") as f:
-            out = f.read()
+def _first_2000_chars(data: bytes) -> str:
+    return data[:2000].decode("utf-8", "replace").strip()
 
-        if not out:
-            raise RuntimeError(f"No data in JSON output file generated from {fcstd_path}")
+
+def _slice_and_parse_json(fcstd_path: str, data: bytes) -> Dict[str, Any]:
+    # The payload stays bytes all the way into the JSON parser — every parser
+    # here accepts bytes, and skipping the up-front str decode saves a full
+    # pass over the payload. Text is only decoded for error messages.
+    begin = data.find(_JSON_BEGIN_SENTINEL)
+    end = data.rfind(_JSON_END_SENTINEL)
+    if begin < 0 or end < begin:
+        raise RuntimeError(
+            f"No JSON payload in FreeCAD output for {fcstd_path}\n"
+            f"STDOUT (first 2000 chars):\n{_first_2000_chars(data)}"
+        )
+    out = data[begin + len(_JSON_BEGIN_SENTINEL) : end]
 
     try:
-        return json.loads(out)
-    except json.JSONDecodeError as e:
+        return _json_loads(out)
+    except ValueError as e:
         raise RuntimeError(
             f"Invalid JSON from FreeCAD for {fcstd_path}: {e}\n"
-            f"STDOUT (first 2000 chars):\n{out[:2000]}"
+            f"STDOUT (first 2000 chars):\n{_first_2000_chars(out)}"
+        )
+
+
+def _parse_freecad_output(
+    fcstd_path: str, returncode: int, stdout: bytes, stderr: bytes
+) -> Dict[str, Any]:
+    if returncode != 0:
+        raise RuntimeError(
+            f"FreeCAD run failed (rc={returncode}) for {fcstd_path}\n"
+            f"STDERR:\n{_first_2000_chars(stderr)}\n\n"
+            f"STDOUT (first 2000 chars):\n{_first_2000_chars(stdout)}"
+        )
+    return _slice_and_parse_json(fcstd_path, stdout)
+
+
+async def run_freecad_script_async(
+    freecad_exe: str, script_path: str, fcstd_path: str, timeout_s: float
+) -> Dict[str, Any]:
+    """
+    Run one freecadcmd process for one .FCStd file. The child is multiplexed
+    on the event loop instead of parking a thread in waitpid, so hundreds of
+    one-shot FreeCAD runs can be in flight from a single OS thread.
+    """
+    cmd = [freecad_exe, script_path, fcstd_path]
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout_s)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout_s)
+    except asyncio.CancelledError:
+        # --fail-fast cancels in-flight tasks; do not leave the child running.
+        proc.kill()
+        raise
+    return _parse_freecad_output(fcstd_path, proc.returncode, stdout, stderr)
+
+
+# Terminates each report in the macro's --server mode (must match
+# EvaluateFile.FCMacro).
+_RECORD_SEPARATOR = b"\x1e"
+
+
+class FreeCADWorker:
+    """
+    A persistent freecadcmd process running EvaluateFile.FCMacro in --server
+    mode. Starting FreeCAD pays the full interpreter/module import cost (often
+    seconds), so a worker is started once and then fed .FCStd paths over stdin,
+    amortizing that startup across every file the worker evaluates.
+    """
+
+    def __init__(self, freecad_exe: str, script_path: str):
+        # stderr is discarded: in server mode per-file failures come back as
+        # {"error": ...} records, and draining a second pipe here would risk
+        # deadlock.
+        self._proc = subprocess.Popen(
+            [freecad_exe, script_path, "--server"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
         )
+        self._buf = b""
+
+    def alive(self) -> bool:
+        return self._proc.poll() is None
 
+    def kill(self) -> None:
+        try:
+            self._proc.kill()
+            self._proc.wait()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=10.0)
+        except Exception:
+            self.kill()
+
+    def evaluate(self, fcstd_path: str, timeout_s: float) -> Dict[str, Any]:
+        self._proc.stdin.write(fcstd_path.encode("utf-8") + b"\n")
+        self._proc.stdin.flush()
+        record = self._read_record(fcstd_path, timeout_s)
+        report = _slice_and_parse_json(fcstd_path, record)
+        if isinstance(report, dict) and "error" in report:
+            raise RuntimeError(f"FreeCAD evaluation failed for {fcstd_path}: {report['error']}")
+        return report
+
+    def _read_record(self, fcstd_path: str, timeout_s: float) -> bytes:
+        deadline = time.monotonic() + timeout_s
+        fd = self._proc.stdout.fileno()
+        while _RECORD_SEPARATOR not in self._buf:
+            if os.name != "nt":
+                # select() cannot watch pipes on Windows; there we block without
+                # a per-file timeout (use --no-persistent if that matters).
+                remaining = deadline - time.monotonic()
+                ready = remaining > 0 and select.select([fd], [], [], remaining)[0]
+                if not ready:
+                    self.kill()
+                    raise subprocess.TimeoutExpired(self._proc.args, timeout_s)
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                self.kill()
+                raise RuntimeError(f"FreeCAD worker exited while evaluating {fcstd_path}")
+            self._buf += chunk
+        record, _, self._buf = self._buf.partition(_RECORD_SEPARATOR)
+        return record
+
+
+class WorkerPool:
+    """
+    Thread-local cache of FreeCADWorker instances: each executor thread gets its
+    own persistent FreeCAD process, created on first use (and recreated if it
+    dies) and reused for every file that thread processes.
+    """
 
-def load_json(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    def __init__(self, freecad_exe: str, script_path: str):
+        self._freecad_exe = freecad_exe
+        self._script_path = script_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._workers: List[FreeCADWorker] = []
+
+    def get(self) -> FreeCADWorker:
+        worker = getattr(self._local, "worker", None)
+        if worker is None or not worker.alive():
+            worker = FreeCADWorker(self._freecad_exe, self._script_path)
+            self._local.worker = worker
+            with self._lock:
+                self._workers.append(worker)
+        return worker
+
+    def close_all(self) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+
+
+def load_json(path: str) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
 
 
 def extract_metrics(report: Dict[str, Any]) -> Dict[SolidKey, Dict]:
@@ -176,52 +363,208 @@ def extract_metrics(report: Dict[str, Any]) -> Dict[SolidKey, Dict]:
     if not isinstance(objects, dict):
         return out
 
+    # Bind the builtins used per solid to locals: LOAD_FAST is measurably
+    # cheaper than a global lookup when this loop runs over reports carrying
+    # thousands of solids.
+    _isinstance = isinstance
+    _dict = dict
+    _int = int
+    _str = str
+    _list = list
+
     for obj_name, obj_entry in objects.items():
-        if not isinstance(obj_entry, dict):
+        if not _isinstance(obj_entry, _dict):
             continue
-        solids = obj_entry.get("solids", [])
-        if not isinstance(solids, list):
+        solids = obj_entry.get("solids")
+        if not _isinstance(solids, _list):
             continue
 
         for s in solids:
-            if not isinstance(s, dict):
+            if not _isinstance(s, _dict):
                 continue
-            object_name = s.get("object_name") or obj_name
             idx = s.get("index")
-            metrics = s.get("metrics", {})
-            if not isinstance(metrics, dict):
+            metrics = s.get("metrics")
+            if not (_isinstance(idx, _int) and _isinstance(metrics, _dict)):
                 continue
 
-            if isinstance(object_name, str) and isinstance(idx, int):
+            object_name = s.get("object_name") or obj_name
+            if _isinstance(object_name, _str):
                 out[(object_name, idx)] = metrics
 
     return out
 
 
-def compare_maps(
-    baseline: Dict[SolidKey, Dict], new: Dict[SolidKey, Dict], cfg: CompareConfig
-) -> List[SolidDiff]:
+def _flatten_metric_leaves(metric: str, value: Any, out: List[Tuple[str, Any]]) -> None:
+    """
+    Flatten a (possibly nested) metrics dictionary into (leaf_name, value)
+    pairs, using the same metric naming scheme as compare_individual_metrics.
+    """
+    if isinstance(value, dict):
+        for sub_metric, sub_value in value.items():
+            _flatten_metric_leaves(f"{metric}_{sub_metric}", sub_value, out)
+    else:
+        out.append((metric, value))
 
-    diffs: List[SolidDiff] = []
 
-    all_keys = set(baseline.keys()) | set(new.keys())
-    for key in sorted(all_keys, key=lambda k: (k[0], k[1])):
-        b = baseline.get(key)
+def _compare_maps_vectorized(
+    baseline: Dict[SolidKey, Dict], new: Dict[SolidKey, Dict], cfg: CompareConfig
+) -> Tuple[int, List[SolidDiff]]:
+    """
+    NumPy variant of compare_maps: float metrics from all solids are packed
+    into two aligned arrays and checked in one vectorized pass. Solids whose
+    metrics are not all floats, or whose structure differs between baseline and
+    new, fall back to the per-value scalar comparison.
+    """
+    compared = 0
+    diffs: List[SolidDiff] = []
+    vec_names: List[Tuple[SolidKey, str]] = []  # (solid key, leaf metric name)
+    b_vals: List[float] = []
+    n_vals: List[float] = []
+
+    # Iterate baseline.items() directly (one hash lookup per key via new.get)
+    # rather than building a union set and probing both maps per key. Iteration
+    # order does not matter: only the failures are ever shown, so just the
+    # (typically tiny) bad list is sorted before returning.
+    for key, b in baseline.items():
         n = new.get(key)
-
-        if b is None:
+        if n is None:
+            compared += 1
             diffs.append(
                 SolidDiff(
                     key=key,
                     baseline=None,
-                    new=n,
+                    new=None,
                     rel_err=None,
                     ok=False,
-                    reason="missing_in_baseline",
+                    reason="missing_in_new",
                 )
             )
             continue
+
+        b_leaves: List[Tuple[str, Any]] = []
+        n_leaves: List[Tuple[str, Any]] = []
+        _flatten_metric_leaves("metric", b, b_leaves)
+        _flatten_metric_leaves("metric", n, n_leaves)
+
+        if len(b_leaves) == len(n_leaves) and all(
+            b_name == n_name and isinstance(b_value, float) and isinstance(n_value, float)
+            for (b_name, b_value), (n_name, n_value) in zip(b_leaves, n_leaves)
+        ):
+            for (name, b_value), (_, n_value) in zip(b_leaves, n_leaves):
+                # Bit-identical values are trivially OK — keep them out of the
+                # arrays entirely so the vectorized pass only sees changes.
+                if b_value == n_value:
+                    compared += 1
+                    continue
+                vec_names.append((key, name))
+                b_vals.append(b_value)
+                n_vals.append(n_value)
+        else:
+            sub_compared, sub_bad = compare_individual_metrics(cfg, key, "metric", b, n)
+            compared += sub_compared
+            diffs.extend(sub_bad)
+
+    for key in new.keys() - baseline.keys():
+        compared += 1
+        diffs.append(
+            SolidDiff(
+                key=key,
+                baseline=None,
+                new=new[key],
+                rel_err=None,
+                ok=False,
+                reason="missing_in_baseline",
+            )
+        )
+
+    if vec_names:
+        compared += len(vec_names)
+        b_arr = np.array(b_vals, dtype=np.float64)
+        n_arr = np.array(n_vals, dtype=np.float64)
+        err = np.abs(n_arr - b_arr)
+        denom = np.maximum(np.abs(b_arr), np.abs(n_arr))
+        tol = np.maximum(cfg.abs_tol_mm3, cfg.rel_tol * denom)
+        ok = err <= tol
+        rel_err = np.divide(err, denom, out=np.zeros_like(err), where=denom > 0)
+        rel_err[(denom == 0) & (err != 0)] = np.inf
+
+        # Only the failures are ever printed, so SolidDiff rows are built for
+        # those alone; the (typically overwhelming) OK majority costs nothing.
+        for i in np.flatnonzero(~ok):
+            key, name = vec_names[i]
+            diffs.append(
+                SolidDiff(
+                    key=key,
+                    baseline=b_vals[i],
+                    new=n_vals[i],
+                    rel_err=float(rel_err[i]),
+                    ok=False,
+                    reason=f"{name}_mismatch",
+                )
+            )
+
+    diffs.sort(key=lambda d: d.key)
+    return compared, diffs
+
+
+_BASELINE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "fcintegration")
+
+
+def load_baseline_metrics(path: str) -> Dict[SolidKey, Dict]:
+    """
+    Load a baseline file and return its extracted metrics map, memoized on
+    disk. Baselines change rarely but are re-parsed on every invocation, so the
+    extracted map is pickled under ~/.cache/fcintegration keyed on the file's
+    name, mtime, and size; warm runs skip the JSON parse entirely, and a
+    changed baseline simply misses the cache. Caching is best-effort — any
+    cache I/O problem falls back to a plain parse.
+    """
+    st = os.stat(path)
+    basename = os.path.basename(path)
+    cache_path = os.path.join(_BASELINE_CACHE_DIR, f"{basename}-{st.st_mtime_ns}-{st.st_size}.pkl")
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+
+    metrics = extract_metrics(load_json(path))
+
+    try:
+        os.makedirs(_BASELINE_CACHE_DIR, exist_ok=True)
+        # Write-to-temp + os.replace keeps concurrent workers from ever seeing
+        # a partially written cache entry.
+        tmp_path = cache_path + f".tmp{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(metrics, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return metrics
+
+
+def compare_maps(
+    baseline: Dict[SolidKey, Dict], new: Dict[SolidKey, Dict], cfg: CompareConfig
+) -> Tuple[int, List[SolidDiff]]:
+    """
+    Compare two metrics maps; returns (total_compared, bad_diffs). SolidDiff
+    rows are only constructed for failures — OK values are counted but never
+    materialized, since the caller never reads them.
+    """
+    if np is not None:
+        return _compare_maps_vectorized(baseline, new, cfg)
+
+    compared = 0
+    diffs: List[SolidDiff] = []
+
+    # As in the vectorized path: iterate baseline.items() with a single
+    # new.get() probe per key, handle baseline-only keys inline, and sweep up
+    # new-only keys with one set difference afterwards.
+    for key, b in baseline.items():
+        n = new.get(key)
         if n is None:
+            compared += 1
             diffs.append(
                 SolidDiff(
                     key=key,
@@ -234,21 +577,39 @@ def compare_maps(
             )
             continue
 
-        diffs.extend(compare_individual_metrics(cfg, key, "metric", b, n))
+        sub_compared, sub_bad = compare_individual_metrics(cfg, key, "metric", b, n)
+        compared += sub_compared
+        diffs.extend(sub_bad)
+
+    for key in new.keys() - baseline.keys():
+        compared += 1
+        diffs.append(
+            SolidDiff(
+                key=key,
+                baseline=None,
+                new=new[key],
+                rel_err=None,
+                ok=False,
+                reason="missing_in_baseline",
+            )
+        )
 
-    return diffs
+    diffs.sort(key=lambda d: d.key)
+    return compared, diffs
 
 
 def compare_individual_metrics(
     cfg: CompareConfig, key: SolidKey, metric: str, baseline: Any, new: Any
-) -> List[SolidDiff]:
+) -> Tuple[int, List[SolidDiff]]:
     """
     Given a baseline and new version of some sort of metric, see if they are equal (or nearly
     equal). Supports elements and dictionaries containing elements that ultimately result in floats,
     ints, bools, or strings. Only the float comparison is fuzzy, the others must be exact matches.
+
+    Returns (compared_count, bad_diffs): SolidDiff rows are only built for failures.
     """
     if not isinstance(baseline, type(new)):
-        return [
+        return 1, [
             SolidDiff(
                 key=key,
                 baseline=baseline,
@@ -259,43 +620,51 @@ def compare_individual_metrics(
             )
         ]
     if isinstance(baseline, int) or isinstance(baseline, bool) or isinstance(baseline, str):
-        ok = baseline == new
-        return [
+        if baseline == new:
+            return 1, []
+        return 1, [
             SolidDiff(
                 key=key,
                 baseline=baseline,
                 new=new,
                 rel_err=0,
-                ok=ok,
-                reason="ok" if ok else f"{metric}_mismatch",
+                ok=False,
+                reason=f"{metric}_mismatch",
             )
         ]
     elif isinstance(baseline, float):
-        # Fuzzy compare: pass if |n-b| <= max(abs_tol, rel_tol*max(|b|,|n|))
-        rel_tol = required_rel_tol(cfg.match_pct)
+        # Fuzzy compare: pass if |n-b| <= max(abs_tol, rel_tol*max(|b|,|n|)).
+        # Bit-identical values (by far the common case when nothing regressed)
+        # short-circuit before any arithmetic, and math.isclose applies exactly
+        # the tolerance formula above in a single C call; the explicit
+        # tolerance/relative-error computation only runs for failures.
+        if baseline == new or math.isclose(
+            new, baseline, rel_tol=cfg.rel_tol, abs_tol=cfg.abs_tol_mm3
+        ):
+            return 1, []
+
         denom = max(abs(baseline), abs(new))
-        tol = max(cfg.abs_tol_mm3, rel_tol * denom)
         err = abs(new - baseline)
-
-        ok = err <= tol
         rel_err = (err / denom) if denom > 0 else (0.0 if err == 0 else math.inf)
 
-        return [
+        return 1, [
             SolidDiff(
                 key=key,
                 baseline=baseline,
                 new=new,
                 rel_err=rel_err,
-                ok=ok,
-                reason="ok" if ok else f"{metric}_mismatch",
+                ok=False,
+                reason=f"{metric}_mismatch",
             )
         ]
     elif isinstance(baseline, dict):
         # Recursively descend into this dictionary
-        results = []
+        compared = 0
+        bad: List[SolidDiff] = []
         for sub_metric in baseline.keys():
             if sub_metric not in new:
-                results.append(
+                compared += 1
+                bad.append(
                     SolidDiff(
                         key=key,
                         baseline=None,
@@ -306,19 +675,129 @@ def compare_individual_metrics(
                     )
                 )
             else:
-                results.extend(
-                    compare_individual_metrics(
-                        cfg, key, f"{metric}_{sub_metric}", baseline[sub_metric], new[sub_metric]
-                    )
+                sub_compared, sub_bad = compare_individual_metrics(
+                    cfg, key, f"{metric}_{sub_metric}", baseline[sub_metric], new[sub_metric]
                 )
-        return results
+                compared += sub_compared
+                bad.extend(sub_bad)
+        return compared, bad
     raise ValueError(f"Unrecognized data type for {metric}")
 
 
+def _walk_fcstd_files(root: Path, recursive: bool):
+    # os.scandir reuses the file-type information readdir already returned, so
+    # unlike glob() + is_file() this does not pay a stat() call per entry.
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False) and entry.name.endswith(".FCStd"):
+                yield Path(entry.path)
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                yield from _walk_fcstd_files(Path(entry.path), True)
+
+
 def find_fcstd_files(root: Path, recursive: bool) -> List[Path]:
-    if recursive:
-        return sorted([p for p in root.rglob("*.FCStd") if p.is_file()])
-    return sorted([p for p in root.glob("*.FCStd") if p.is_file()])
+    return sorted(_walk_fcstd_files(root, recursive))
+
+
+def _format_diff(d: SolidDiff, cfg: CompareConfig) -> str:
+    if d.reason in ("missing_in_baseline", "missing_in_new"):
+        return f"  - {d.reason}: {d.key}"
+    rel_pct = (d.rel_err * 100.0) if (d.rel_err is not None and math.isfinite(d.rel_err)) else None
+    rel_str = f"{rel_pct:.9f}%" if rel_pct is not None else "inf"
+    return (
+        f"  - {d.reason} {d.key}: baseline={d.baseline:.12g} new={d.new:.12g} "
+        f"rel_err={rel_str} (required match >= {cfg.match_pct}%)"
+    )
+
+
+def _compare_and_report(
+    fcstd_name: str,
+    base_map: Dict[SolidKey, Dict],
+    new_report: Dict[str, Any],
+    cfg: CompareConfig,
+    args: argparse.Namespace,
+) -> Tuple[str, List[str], List[str]]:
+    out_lines: List[str] = []
+
+    new_map = extract_metrics(new_report)
+    compared, bad = compare_maps(base_map, new_map, cfg)
+
+    if bad:
+        out_lines.append(f"[FAIL] {fcstd_name}: {len(bad)} issue(s)")
+        out_lines.extend(_format_diff(d, cfg) for d in bad)
+        if args.verbose:
+            out_lines.append(
+                f"  solids compared: {compared} (ok={compared-len(bad)} bad={len(bad)})"
+            )
+        return "mismatch", out_lines, []
+
+    if args.verbose:
+        out_lines.append(f"[OK]   {fcstd_name}: solids={compared}")
+    return "ok", out_lines, []
+
+
+def _process_one(
+    fcstd_path: str,
+    baseline_path: str,
+    cfg: CompareConfig,
+    args: argparse.Namespace,
+    worker_pool: WorkerPool,
+    baseline_future: Optional[Future[Dict[SolidKey, Dict]]],
+) -> Tuple[str, List[str], List[str]]:
+    """
+    Run FreeCAD on a single .FCStd file and compare against its baseline.
+
+    Returns (status, stdout_lines, stderr_lines) where status is one of "ok",
+    "mismatch", or "error". Output lines are collected rather than printed so
+    that parallel runs do not interleave.
+    """
+    name = os.path.basename(fcstd_path)
+
+    if baseline_future is None:
+        return "mismatch", [], [f"[FAIL] {name}: baseline missing: {baseline_path}"]
+
+    try:
+        new_report = worker_pool.get().evaluate(fcstd_path, timeout_s=float(args.timeout))
+        return _compare_and_report(name, baseline_future.result(), new_report, cfg, args)
+    except subprocess.TimeoutExpired:
+        return "error", [], [f"[ERROR] {name}: timed out after {args.timeout}s"]
+    except Exception as e:
+        return "error", [], [f"[ERROR] {name}: {e}"]
+
+
+async def _process_one_async(
+    fcstd_path: str,
+    baseline_path: str,
+    freecad_exe: str,
+    script_path: str,
+    cfg: CompareConfig,
+    args: argparse.Namespace,
+    semaphore: asyncio.Semaphore,
+    baseline_future: Optional[Future[Dict[SolidKey, Dict]]],
+) -> Tuple[str, List[str], List[str]]:
+    """
+    One-shot (--no-persistent) counterpart of _process_one, driven by the
+    event loop instead of an executor thread.
+    """
+    name = os.path.basename(fcstd_path)
+
+    if baseline_future is None:
+        return "mismatch", [], [f"[FAIL] {name}: baseline missing: {baseline_path}"]
+
+    try:
+        async with semaphore:
+            new_report = await run_freecad_script_async(
+                freecad_exe=freecad_exe,
+                script_path=script_path,
+                fcstd_path=fcstd_path,
+                timeout_s=float(args.timeout),
+            )
+        base_map = await asyncio.wrap_future(baseline_future)
+        return _compare_and_report(name, base_map, new_report, cfg, args)
+    except subprocess.TimeoutExpired:
+        return "error", [], [f"[ERROR] {name}: timed out after {args.timeout}s"]
+    except Exception as e:
+        return "error", [], [f"[ERROR] {name}: {e}"]
 
 
 def main(argv: List[str]) -> int:
@@ -334,7 +813,11 @@ def main(argv: List[str]) -> int:
             print(f"ERROR: Path does not exist: {p}", file=sys.stderr)
             return 3
 
-    cfg = CompareConfig(match_pct=float(args.match_pct), abs_tol_mm3=float(args.abs_tol_mm3))
+    cfg = CompareConfig(
+        match_pct=float(args.match_pct),
+        abs_tol_mm3=float(args.abs_tol_mm3),
+        rel_tol=required_rel_tol(float(args.match_pct)),
+    )
 
     fcstd_files = find_fcstd_files(fcstd_dir, args.recursive)
     if not fcstd_files:
@@ -346,70 +829,113 @@ def main(argv: List[str]) -> int:
     mismatch_files = 0
     error_files = 0
 
-    for fcstd_path in fcstd_files:
-        total_files += 1
-        stem = fcstd_path.stem
-        baseline_path = baseline_dir / f"{stem}.json"
+    max_workers = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
-        if not baseline_path.exists():
-            print(f"[FAIL] {fcstd_path.name}: baseline missing: {baseline_path}", file=sys.stderr)
+    def consume(result: Tuple[str, List[str], List[str]]) -> str:
+        nonlocal total_files, ok_files, mismatch_files, error_files
+        status, out_lines, err_lines = result
+        total_files += 1
+        if status == "ok":
+            ok_files += 1
+        elif status == "mismatch":
             mismatch_files += 1
-            continue
-
-        try:
-            new_report = run_freecad_script(
-                freecad_exe=freecad_exe,
-                script_path=script_path,
-                fcstd_path=fcstd_path,
-                timeout_s=float(args.timeout),
+        else:
+            error_files += 1
+        # One write per stream per file: joining the buffered lines avoids a
+        # flush per line on line-buffered terminals.
+        if out_lines:
+            print("\n".join(out_lines))
+        if err_lines:
+            print("\n".join(err_lines), file=sys.stderr)
+        return status
+
+    # The per-file loop works on plain strings: pathlib stays at the
+    # argument-parsing boundary above, since Path construction, joins, .stem,
+    # and .exists() each cost allocations and Python-level calls that os.path
+    # avoids in this hot path.
+    freecad_str = os.fspath(freecad_exe)
+    script_str = os.fspath(script_path)
+    baseline_dir_str = os.fspath(baseline_dir)
+
+    # Baselines do not depend on the FreeCAD run, so start reading them on a
+    # small thread pool up front; the loads overlap the (much slower) FreeCAD
+    # startup and are usually finished by the time the first report arrives.
+    # Files without a baseline get no future and are reported as mismatches.
+    with ThreadPoolExecutor(max_workers=min(8, max_workers)) as prefetch_executor:
+        work_items: List[Tuple[str, str, Optional[Future[Dict[SolidKey, Dict]]]]] = []
+        for fcstd_path in fcstd_files:
+            fcstd_str = os.fspath(fcstd_path)
+            stem = os.path.splitext(os.path.basename(fcstd_str))[0]
+            baseline_str = os.path.join(baseline_dir_str, stem + ".json")
+            future = (
+                prefetch_executor.submit(load_baseline_metrics, baseline_str)
+                if os.path.exists(baseline_str)
+                else None
             )
-            base_report = load_json(baseline_path)
-
-            new_map = extract_metrics(new_report)
-            base_map = extract_metrics(base_report)
-
-            diffs = compare_maps(base_map, new_map, cfg)
-            bad = [d for d in diffs if not d.ok]
-
-            if bad:
-                mismatch_files += 1
-                print(f"[FAIL] {fcstd_path.name}: {len(bad)} issue(s)")
-                for d in bad:
-                    if d.reason in ("missing_in_baseline", "missing_in_new"):
-                        print(f"  - {d.reason}: {d.key}")
-                    else:
-                        rel_pct = (
-                            (d.rel_err * 100.0)
-                            if (d.rel_err is not None and math.isfinite(d.rel_err))
-                            else None
-                        )
-                        rel_str = f"{rel_pct:.9f}%" if rel_pct is not None else "inf"
-                        print(
-                            f"  - {d.reason} {d.key}: baseline={d.baseline:.12g} new={d.new:.12g} "
-                            f"rel_err={rel_str} (required match >= {cfg.match_pct}%)"
+            work_items.append((fcstd_str, baseline_str, future))
+
+        # Files are independent, so the FreeCAD runs proceed in parallel either
+        # way. Persistent --server workers block on pipe reads, so they get one
+        # executor thread each; one-shot runs only wait on child-process I/O,
+        # which a single event loop can multiplex without a thread per child.
+        if args.no_persistent:
+
+            async def dispatch() -> None:
+                semaphore = asyncio.Semaphore(max_workers)
+                tasks = [
+                    asyncio.ensure_future(
+                        _process_one_async(
+                            fcstd_str,
+                            baseline_str,
+                            freecad_str,
+                            script_str,
+                            cfg,
+                            args,
+                            semaphore,
+                            baseline_future,
                         )
-                if args.verbose:
-                    print(
-                        f"  solids compared: {len(diffs)} (ok={len(diffs)-len(bad)} bad={len(bad)})"
                     )
-            else:
-                ok_files += 1
-                if args.verbose:
-                    print(f"[OK]   {fcstd_path.name}: solids={len(diffs)}")
-
-        except subprocess.TimeoutExpired:
-            error_files += 1
-            print(f"[ERROR] {fcstd_path.name}: timed out after {args.timeout}s", file=sys.stderr)
-        except Exception as e:
-            error_files += 1
-            print(f"[ERROR] {fcstd_path.name}: {e}", file=sys.stderr)
+                    for fcstd_str, baseline_str, baseline_future in work_items
+                ]
+                for task in asyncio.as_completed(tasks):
+                    status = consume(await task)
+                    if args.fail_fast and status != "ok":
+                        for pending in tasks:
+                            pending.cancel()
+                        break
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            asyncio.run(dispatch())
+        else:
+            worker_pool = WorkerPool(freecad_str, script_str)
+            try:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(
+                            _process_one,
+                            fcstd_str,
+                            baseline_str,
+                            cfg,
+                            args,
+                            worker_pool,
+                            baseline_future,
+                        )
+                        for fcstd_str, baseline_str, baseline_future in work_items
+                    ]
+                    for future in as_completed(futures):
+                        status = consume(future.result())
+                        if args.fail_fast and status != "ok":
+                            executor.shutdown(cancel_futures=True)
+                            break
+            finally:
+                worker_pool.close_all()
 
     print("\n" + 35 * "=" + " Summary " + 35 * "=")
     print(f"Files checked: {total_files}")
     print(f"OK:            {ok_files}")
     print(f"Mismatched:    {mismatch_files}")
     print(f"Errors:        {error_files}")
-    print(f"Match pct:     {cfg.match_pct} (rel_tol={required_rel_tol(cfg.match_pct):.12g})")
+    print(f"Match pct:     {cfg.match_pct} (rel_tol={cfg.rel_tol:.12g})")
     print(f"Abs tol mm^3:  {cfg.abs_tol_mm3:.12g}")
     print(79 * "=")
 